@@ -152,7 +152,7 @@ class API(metaclass=Singleton):
 
         :returns <dict|requests.Response>:
         """
-        self.log.debug(f"{method}: {url}")
+        self.log.debug("%s: %s", method, url)
         if isinstance(data, dict):
             data = convert.dict_to_xml(data)
             data = data.encode("utf-8")
@@ -238,3 +238,28 @@ class API(metaclass=Singleton):
         if self.session:
             self.log.debug("closing session")
             self.session.close()
+
+
+def create_api(
+    config_path=None, hostname=None, username=None, password=None, prompt=True
+):
+    """
+    Create a new API object without replacing the shared API() instance
+
+    :param config_path <str>:    Path to file containing config
+    :param hostname <str>:       Hostname of server
+    :param username <str>:       username for server
+    :param password <str>:       password for server
+    :param prompt <bool>:        Allow the script to prompt if any info is missing
+
+    :returns <API>:
+    """
+    # bypass Singleton.__call__ so API._instances isn't consulted or updated
+    return type.__call__(
+        API,
+        config_path=config_path,
+        hostname=hostname,
+        username=username,
+        password=password,
+        prompt=prompt,
+    )
@@ -15,6 +15,7 @@ import logging
 import plistlib
 from datetime import datetime
 from os import path, remove
+from pathlib import Path
 from sys import stderr
 
 import keyring
@@ -89,18 +90,25 @@ class Config:
 
     def load(self):
         if path.exists(self.config_path):
-            fptr = open(self.config_path, "rb")
-            try:
-                prefs = plistlib.load(fptr)
-            except plistlib.InvalidFileException:
-                fptr.close()
-                raise JamfConfigError(
-                    f"Could not load {self.config_path}, isit plist formatted?"
-                )
-            fptr.close()
-            if "JSSHostname" in prefs:
-                if "Credentials" in prefs:
-                    cmessage = f"""
+            self.loads(Path(self.config_path).read_bytes())
+        else:
+            raise JamfConfigError(f"Config file does not exist: {self.config_path}")
+
+    def loads(self, data):
+        """
+        Load prefs from plist bytes (see load)
+
+        :param data <bytes>:  plist formatted config
+        """
+        try:
+            prefs = plistlib.loads(data)
+        except plistlib.InvalidFileException:
+            raise JamfConfigError(
+                f"Could not load {self.config_path}, isit plist formatted?"
+            )
+        if "JSSHostname" in prefs:
+            if "Credentials" in prefs:
+                cmessage = f"""
 ATTENTION
 To improve security with storing credentials used with the jctl tool, we have
 deprecated the use of a property list file for storing configuration
@@ -111,35 +119,39 @@ the macOS Keychain and Linux KWallet.
 Please delete the the configuration at {self.config_path} and recreate it using
 the "conf-python-jamf" script.
 """
-                    raise JamfConfigError(cmessage)
-                self.hostname = prefs["JSSHostname"]
-                self.username = prefs["Username"]
-                if "APIClientAuth" in prefs:
-                    self.client = prefs["APIClientAuth"]
-                else:
-                    self.client = False
-                self.password = keyring.get_password(self.hostname, self.username)
-            elif "JSS_URL" in prefs:
-                self.hostname = prefs["JSS_URL"]
-                self.username = prefs["API_USERNAME"]
-                self.password = prefs["API_PASSWORD"]
-            elif "jss_url" in prefs:
-                self.hostname = prefs["jss_url"]
-                # No auth in that file
-        else:
-            raise JamfConfigError(f"Config file does not exist: {self.config_path}")
+                raise JamfConfigError(cmessage)
+            self.hostname = prefs["JSSHostname"]
+            self.username = prefs["Username"]
+            if "APIClientAuth" in prefs:
+                self.client = prefs["APIClientAuth"]
+            else:
+                self.client = False
+            self.password = keyring.get_password(self.hostname, self.username)
+        elif "JSS_URL" in prefs:
+            self.hostname = prefs["JSS_URL"]
+            self.username = prefs["API_USERNAME"]
+            self.password = prefs["API_PASSWORD"]
+        elif "jss_url" in prefs:
+            self.hostname = prefs["jss_url"]
+            # No auth in that file
 
     def save(self):
         keyring.set_password(self.hostname, self.username, self.password)
+        self.log.info(f"saving: {self.config_path}")
+        Path(self.config_path).write_bytes(self.dumps())
+
+    def dumps(self):
+        """
+        Serialize prefs to plist bytes (see save)
+
+        :returns <bytes>:
+        """
         data = {
             "JSSHostname": self.hostname,
             "Username": self.username,
             "APIClientAuth": self.client,
         }
-        self.log.info(f"saving: {self.config_path}")
-        fptr = open(self.config_path, "wb")
-        plistlib.dump(data, fptr)
-        fptr.close()
+        return plistlib.dumps(data)
 
     def load_token(self):
         self.token = keyring.get_password(self.hostname, TOKEN_KEY)
@@ -10,9 +10,13 @@ __copyright__ = "Copyright (c) 2019 University of Utah, Marriott Library"
 __license__ = "MIT"
 __version__ = "0.2.2"
 
+import sys
 import xml.sax.saxutils
 from collections import defaultdict
-from xml.etree import cElementTree as ElementTree
+from xml.etree import ElementTree
+
+# <size>0</size> children are dropped from the converted dict
+_EMPTY_SIZE = {"size": "0"}
 
 
 class Error(Exception):
@@ -21,18 +25,28 @@ class Error(Exception):
     pass
 
 
+class ParseError(Error, ElementTree.ParseError):
+    """malformed xml"""
+
+    pass
+
+
 def etree_to_dict(elem, plurals):
     """
-    converts xml.cElementTree to python dict
+    converts ElementTree element to python dict
     adapted from: https://stackoverflow.com/a/10077069/12020818
     removed attribute support
     """
-    result = {elem.tag: None}
+    # one shared str per tag name in the returned keys
+    tag = sys.intern(elem.tag)
+    result = {tag: None}
     plurals2 = None
+    tag_plurals = None
     is_list = False
-    if plurals is not None and elem.tag in plurals:
-        if type(plurals[elem.tag]) is not list:
-            plurals2 = plurals[elem.tag]
+    if plurals is not None and tag in plurals:
+        tag_plurals = plurals[tag]
+        if type(tag_plurals) is not list:
+            plurals2 = tag_plurals
     children = list(elem)
     if children:
         child_dict = defaultdict(list)
@@ -41,28 +55,28 @@ def etree_to_dict(elem, plurals):
             if child.tag == "size":
                 has_size = True
             converted = etree_to_dict(child, plurals2)
-            if converted != {"size": "0"}:
+            if converted != _EMPTY_SIZE:
                 for key, val in converted.items():
                     child_dict[key].append(val)
         result = {}
+        if child_dict:
+            fields = result[tag] = {}
         for key, val in child_dict.items():
-            #             print(f"{key}, {val[0]}, {type(val[0])}, {has_size}")
             if not is_list:
                 is_list = len(val) > 1 or (has_size and type(val[0]) is dict)
-            if elem.tag not in result:
-                result[elem.tag] = {}
             force_str = False
-            if plurals is not None and elem.tag in plurals and key in plurals[elem.tag]:
-                if type(plurals[elem.tag][key]) is list:
+            if tag_plurals is not None and key in tag_plurals:
+                plural_type = type(tag_plurals[key])
+                if plural_type is list:
                     is_list = True
-                elif type(plurals[elem.tag][key]) is str:
+                elif plural_type is str:
                     force_str = True
             if not force_str and is_list:
-                result[elem.tag][key] = val
+                fields[key] = val
             else:
-                result[elem.tag][key] = val[0]
+                fields[key] = val[0]
     elif elem.text:
-        result[elem.tag] = elem.text.strip()
+        result[tag] = elem.text.strip()
     return result
 
 
@@ -71,32 +85,83 @@ def dict_to_xml(data):
     Convert python dict to xml string
     :returns:  xml string
     """
+    parts = []
+    _append_xml(data, parts)
+    return "".join(parts)
+
+
+def _append_xml(data, parts):
+    """
+    append xml for data to parts (see dict_to_xml)
+    """
     if isinstance(data, dict):
-        xml_str = ""
         for key, value in data.items():
-            if value is None:
-                xml_str += f"<{key}/>"
-            elif isinstance(value, list):
-                # if the value is a list, wrap each entry with the key
-                for i in value:
-                    result = dict_to_xml(i)
-                    xml_str += f"<{key}>{result}</{key}>"
-            else:
-                # otherwise, wrap the entire result
-                result = dict_to_xml(value)
-                xml_str += f"<{key}>{result}</{key}>"
+            writer = _VALUE_WRITERS.get(type(value))
+            if writer is None:
+                writer = _value_writer(value)
+            writer(key, value, parts)
     elif isinstance(data, list):
         raise Error("unable to properly tag nested lists")
     else:
         # string, boolean, integers, floats, etc
-        xml_str = xml.sax.saxutils.escape(f"{data}")
-    return xml_str
+        parts.append(xml.sax.saxutils.escape(f"{data}"))
+
+
+def _write_none(key, value, parts):
+    parts.append(f"<{key}/>")
+
+
+def _write_list(key, value, parts):
+    # if the value is a list, wrap each entry with the key
+    for i in value:
+        parts.append(f"<{key}>")
+        _append_xml(i, parts)
+        parts.append(f"</{key}>")
+
+
+def _write_dict(key, value, parts):
+    # otherwise, wrap the entire result
+    parts.append(f"<{key}>")
+    _append_xml(value, parts)
+    parts.append(f"</{key}>")
+
+
+def _write_text(key, value, parts):
+    # string, boolean, integers, floats, etc
+    text = xml.sax.saxutils.escape(f"{value}")
+    parts.append(f"<{key}>{text}</{key}>")
+
+
+def _value_writer(value):
+    """
+    writer for types missing from _VALUE_WRITERS (e.g. dict subclasses)
+    """
+    if isinstance(value, list):
+        return _write_list
+    if isinstance(value, dict):
+        return _write_dict
+    return _write_text
+
+
+# dict values are dispatched on their exact type
+_VALUE_WRITERS = {
+    type(None): _write_none,
+    str: _write_text,
+    dict: _write_dict,
+    list: _write_list,
+}
 
 
 def xml_to_dict(xml_string, plurals=None):
     """
     Convert xml string to python dict
+
+    The encoding declaration of str input is ignored (it's already decoded)
+    :raises ParseError:  if xml_string is not well-formed
     :returns:  dict
     """
-    root = ElementTree.XML(xml_string)
+    try:
+        root = ElementTree.fromstring(xml_string)
+    except ElementTree.ParseError as e:
+        raise ParseError(f"unable to parse xml: {e}") from e
     return etree_to_dict(root, plurals)
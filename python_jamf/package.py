@@ -353,12 +353,12 @@ class Package:
                     try:
                         versions.append(StrictVersion(v))
                     except ValueError:
-                        self.log.error(f"invalid version: {v!r} (using default)")
+                        self.log.error("invalid version: %r (using default)", v)
                         versions.append(StrictVersion("10.0"))
             # minimum version is the HIGHEST version of all bundles
             # NOTE: if one component requires 10.14.6, but another requires
             #       10.2.0, then the lowest OS the app run on is 10.14.6
-            self.log.debug(f"versions: {sorted(versions)}")
+            self.log.debug("versions: %s", sorted(versions))
             try:
                 self._min_os_ver = sorted(versions)[-1]
             except IndexError:
@@ -456,9 +456,9 @@ class Package:
     def __del__(self):
         try:
             if self.expanded:
-                self.log.debug(f"cleaning up: '{self.expanded}'")
+                self.log.debug("cleaning up: '%s'", self.expanded)
                 shutil.rmtree(self.expanded, ignore_errors=True)
-                self.log.info(f"cleaning up: '{TMPDIR}'")
+                self.log.info("cleaning up: '%s'", TMPDIR)
                 shutil.rmtree(TMPDIR, ignore_errors=True)
         except AttributeError:
             pass
@@ -569,12 +569,12 @@ class Repo:
         """
         if not self.archive.exists():
             # create archive directory if missing
-            self.log.debug(f"creating archive: {self.archive}")
+            self.log.debug("creating archive: %s", self.archive)
             self.archive.mkdir()
         archiving = set(self.packages).intersection(pkgs)
-        self.log.info(f"archiving: {', '.join([x.name for x in archiving])}")
+        self.log.info("archiving: %s", ", ".join([x.name for x in archiving]))
         self._packages = list(set(self.packages).difference(archiving))
-        self.log.debug(f"repo packages: {', '.join([x.name for x in self.packages])}")
+        self.log.debug("repo packages: %s", ", ".join([x.name for x in self.packages]))
         for pkg in archiving:
             _archived = self.archive / pkg.name
             pkg.path.rename(_archived)
@@ -628,9 +628,9 @@ def install_package(pkg, target="/"):
     """
     logger = logging.getLogger(__name__)
     path = pkg.path.absolute() if isinstance(pkg, Package) else pkg
-    logger.info(f"installing package: {path}")
+    logger.info("installing package: %s", path)
     cmd = ["/usr/sbin/installer", "-pkg", path, "-target", target]
-    logger.debug(f"> sudo -n installer -pkg {path!r} -target {target!r}")
+    logger.debug("> sudo -n installer -pkg %r -target %r", path, target)
     subprocess.check_call(["/usr/bin/sudo", "-n"] + cmd)
 
 
@@ -714,7 +714,7 @@ def pkgutil(*args):
     Execute `pkgutil` with specified args (see `man pkgutil` for more info)
     """
     logger = logging.getLogger(__name__)
-    logger.debug(f"args: {args!r}")
+    logger.debug("args: %r", args)
     cmd = ["/usr/sbin/pkgutil"] + [str(x) for x in args]
     out = subprocess.check_output(cmd, stderr=subprocess.PIPE)
     try:
@@ -773,7 +773,7 @@ def calculate_checksums(path, hashes, copy=True, bufsize=8192):
     :returns <list>:           list of updated hashlib.HASH objects
     """
     logger = logging.getLogger(__name__)
-    logger.debug(f"calculating checksums: {path}")
+    logger.debug("calculating checksums: %s", path)
     # copy each hash if specified, otherwise update original hash objects
     hashes = [hash.copy() if copy else hash for hash in hashes]
     with open(path, "rb") as f:
@@ -804,10 +804,10 @@ def extract_tar(payload, path):
 
 def extract(path, payload, save_dir):
     logger = logging.getLogger(__name__)
-    logger.info(f"extracting using xar: '{path}'")
+    logger.info("extracting using xar: '%s'", path)
     if not TMPDIR.exists():
         TMPDIR.mkdir(mode=0o755)
-    logger.debug(f"> xar -xf '{path}' '{payload}' -C '{save_dir}'")
+    logger.debug("> xar -xf '%s' '%s' -C '%s'", path, payload, save_dir)
     _ = subprocess.check_output(["/usr/bin/xar", "-xf", path, payload, "-C", save_dir])
     pkg_info = subprocess.check_output(["/bin/cat", save_dir / payload])
     return pkg_info
@@ -877,7 +877,7 @@ def xattr(*args):
     Execute `xattr` with specified args (see `man pkgutil` for more info)
     """
     logger = logging.getLogger(__name__)
-    logger.debug(f"xattr args: {args!r}")
+    logger.debug("xattr args: %r", args)
     cmd = ["/usr/bin/xattr"] + [str(x) for x in args]
     out = subprocess.check_output(cmd, stderr=subprocess.PIPE)
     return out.decode("utf-8").rstrip()
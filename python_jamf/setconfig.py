@@ -165,7 +165,7 @@ def interactive(args, config_path):
 def setconfig(argv):
     logger = logging.getLogger(__name__)
     args = Parser().parse(argv)
-    logger.debug(f"args: {args!r}")
+    logger.debug("args: %r", args)
     if args.path:
         config_path = args.path
     else:
@@ -1,4 +1,5 @@
 import os
+import pathlib
 import re
 import subprocess
 
@@ -17,11 +18,11 @@ except:
 
 assert os.path.isfile("python_jamf/version.py")
 if jamf_version != "":
-    with open("python_jamf/VERSION", "w", encoding="utf-8") as fh:
-        fh.write(f"{jamf_version}\n")
+    pathlib.Path("python_jamf/VERSION").write_text(
+        f"{jamf_version}\n", encoding="utf-8"
+    )
 
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+long_description = pathlib.Path("README.md").read_text(encoding="utf-8")
 
 setuptools.setup(
     name="python-jamf",
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests for python_jamf.api that don't need a Jamf server
+"""
+
+__author__ = "James Reynolds"
+__email__ = "reynolds@biology.utah.edu"
+__copyright__ = "Copyright (c) 2022 University of Utah"
+__license__ = "MIT"
+__version__ = "0.1.0"
+
+import unittest
+from unittest import mock
+
+from python_jamf import api
+
+HOSTNAME = "http://localhost"
+USERNAME = "python-jamf"
+PASSWORD = "secret"
+
+
+class TestCreateAPI(unittest.TestCase):
+    """
+    create_api() doesn't need a server, Config is patched out
+    """
+
+    def test_create_api_not_shared(self):
+        """
+        test create_api leaves the shared API instance alone
+        """
+        before = dict(api.API._instances)
+        with mock.patch.object(api.config, "Config"):
+            first = api.create_api(
+                hostname=HOSTNAME, username=USERNAME, password=PASSWORD
+            )
+            second = api.create_api(
+                hostname=HOSTNAME, username=USERNAME, password=PASSWORD
+            )
+        self.assertIsInstance(first, api.API)
+        self.assertIsNot(first, second)
+        self.assertEqual(first.hostname, HOSTNAME)
+        self.assertEqual(api.API._instances, before)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
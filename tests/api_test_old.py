@@ -10,10 +10,10 @@ __copyright__ = "Copyright (c) 2022 University of Utah"
 __license__ = "MIT"
 __version__ = "0.1.0"
 
+import functools
 import logging
 import os
-import random
-import string
+import secrets
 import unittest
 
 from python_jamf import api, exceptions
@@ -27,20 +27,13 @@ BAD_HOSTNAME_PORT = "http://github:80"
 BAD_USERNAME = "asdf"
 
 
+@functools.lru_cache(maxsize=None)
 def get_creds():
-    if "JAMF_HOSTNAME" in os.environ:
-        hostname = os.environ["JAMF_HOSTNAME"]
-    else:
-        hostname = HOSTNAME
-    if "JAMF_USERNAME" in os.environ:
-        username = os.environ["JAMF_USERNAME"]
-    else:
-        username = USERNAME
-    if "JAMF_PASSWORD" in os.environ:
-        password = os.environ["JAMF_PASSWORD"]
-    else:
-        password = PASSWORD
-    return (hostname, username, password)
+    return (
+        os.environ.get("JAMF_HOSTNAME", HOSTNAME),
+        os.environ.get("JAMF_USERNAME", USERNAME),
+        os.environ.get("JAMF_PASSWORD", PASSWORD),
+    )
 
 
 class TestHost(unittest.TestCase):
@@ -48,9 +41,8 @@ class TestHost(unittest.TestCase):
         """
         Test successful connection
         """
-        api.API._instances = {}
         hostname, username, password = get_creds()
-        server = api.API(hostname=hostname, username=username, password=password)
+        server = api.create_api(hostname=hostname, username=username, password=password)
         server.revoke_token()
         accounts = server.get("accounts")
         self.assertTrue("accounts" in accounts)
@@ -59,10 +51,9 @@ class TestHost(unittest.TestCase):
         """
         Test bad prefs
         """
-        api.API._instances = {}
         self.assertRaises(
             exceptions.JamfConfigError,
-            lambda: api.API(
+            lambda: api.create_api(
                 config_path="/var/false",
                 hostname="",
                 username="",
@@ -75,9 +66,10 @@ class TestHost(unittest.TestCase):
         """
         Test bad hostname
         """
-        api.API._instances = {}
         hostname, username, password = get_creds()
-        server = api.API(hostname=BAD_HOSTNAME, username=username, password=password)
+        server = api.create_api(
+            hostname=BAD_HOSTNAME, username=username, password=password
+        )
         server.revoke_token()
         self.assertRaises(
             exceptions.JamfNoConnectionError, lambda: server.get("accounts")
@@ -87,9 +79,8 @@ class TestHost(unittest.TestCase):
         """
         Test bad port
         """
-        api.API._instances = {}
         hostname, username, password = get_creds()
-        server = api.API(
+        server = api.create_api(
             hostname=BAD_HOSTNAME_PORT, username=username, password=password
         )
         server.revoke_token()
@@ -101,9 +92,10 @@ class TestHost(unittest.TestCase):
         """
         Test bad username password
         """
-        api.API._instances = {}
         hostname, username, password = get_creds()
-        server = api.API(hostname=hostname, username=BAD_USERNAME, password=password)
+        server = api.create_api(
+            hostname=hostname, username=BAD_USERNAME, password=password
+        )
         server.revoke_token()
         self.assertRaises(
             exceptions.JamfAuthenticationError, lambda: server.get("accounts")
@@ -112,9 +104,10 @@ class TestHost(unittest.TestCase):
 
 class TestAPI(unittest.TestCase):
     def setUp(self):
-        api.API._instances = {}
         hostname, username, password = get_creds()
-        self.server = api.API(hostname=hostname, username=username, password=password)
+        self.server = api.create_api(
+            hostname=hostname, username=username, password=password
+        )
 
     def test_get_token(self):
         """
@@ -152,7 +145,7 @@ class TestAPI(unittest.TestCase):
         """
         Test CRUD: post new record, get, assert email, change email, put, get, assert email, delete, assert not found
         """
-        name = "python-jamf-" + "".join(random.choices(string.ascii_letters, k=16))
+        name = "python-jamf-" + secrets.token_hex(8)
         data = {
             "account": {
                 "access_level": "Full Access",
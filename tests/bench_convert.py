@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=invalid-name, wrong-import-position
+
+"""
+micro-benchmarks for python_jamf.convert over the conversion test fixtures
+
+run from a checkout with the package requirements installed
+(pip install -e .):
+
+    python tests/bench_convert.py --rigorous -o new.json
+    python -m pyperf compare_to baseline.json new.json --table -G
+
+falls back to timeit (best of 5) when pyperf is not installed
+"""
+
+import pathlib
+import sys
+import timeit
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+PATCHPOLICIES = ROOT / "tests" / "data" / "convert" / "patchpolicies.xml"
+
+# the checkout, not just tests/, so python_jamf and tests import from here
+sys.path.insert(0, str(ROOT))
+
+from python_jamf import convert
+from tests import convert_json_xml_test as fixtures
+
+try:
+    import pyperf
+except ImportError:
+    pyperf = None
+
+
+def benchmarks():
+    """
+    (name, func, arg) for every benchmark
+    :returns <list>:
+    """
+    xml = PATCHPOLICIES.read_bytes()
+    data = convert.xml_to_dict(xml)
+    result = [
+        ("xml_to_dict_patchpolicies", convert.xml_to_dict, xml),
+        ("dict_to_xml_patchpolicies", convert.dict_to_xml, data),
+    ]
+    for case in (
+        fixtures.TestSimpleDict,
+        fixtures.TestSimpleList,
+        fixtures.TestListOfDicts,
+        fixtures.TestPatchSoftwareTitle,
+    ):
+        result.append((f"xml_to_dict_{case.__name__}", convert.xml_to_dict, case.xml))
+        result.append((f"dict_to_xml_{case.__name__}", convert.dict_to_xml, case.data))
+    return result
+
+
+def main():
+    if pyperf is None:
+        for name, func, arg in benchmarks():
+            timer = timeit.Timer(lambda: func(arg))
+            number, _ = timer.autorange()
+            best = min(timer.repeat(repeat=5, number=number)) / number
+            print(f"{name}: {best * 1e6:.1f} us")
+        return
+    runner = pyperf.Runner()
+    for name, func, arg in benchmarks():
+        runner.bench_func(name, func, arg)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,10 +11,15 @@ __license__ = "MIT"
 __version__ = "0.2.0"
 
 import logging
+import shutil
+import tempfile
 import unittest
-from os import path, remove
+from os import path
+from pathlib import Path
 
 import keyring
+import keyring.backend
+import keyring.errors
 
 from python_jamf.config import Config
 from python_jamf.exceptions import JamfConfigError
@@ -23,6 +28,30 @@ TOKEN_KEY = "python-jamf-token"
 EXPIRE_KEY = "python-jamf-expires"
 
 
+class _MemKeyring(keyring.backend.KeyringBackend):
+    """
+    In-memory keyring so the tests don't touch the system keyring
+    """
+
+    priority = 1
+
+    def __init__(self):
+        super().__init__()
+        self._store = {}
+
+    def get_password(self, service, username):
+        return self._store.get((service, username))
+
+    def set_password(self, service, username, password):
+        self._store[(service, username)] = password
+
+    def delete_password(self, service, username):
+        try:
+            del self._store[(service, username)]
+        except KeyError:
+            raise keyring.errors.PasswordDeleteError(username)
+
+
 class ConfigTests(unittest.TestCase):
     """
     Test the config class
@@ -30,7 +59,14 @@ class ConfigTests(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.config_path = "/tmp/jamf.config.test.alt.plist"
+        # cleanups run even if the rest of setUpClass fails
+        cls.addClassCleanup(keyring.set_keyring, keyring.get_keyring())
+        keyring.set_keyring(_MemKeyring())
+        # memory-backed scratch space when available (linux)
+        tmp = "/dev/shm" if path.isdir("/dev/shm") else None
+        cls._tmpdir = tempfile.mkdtemp(prefix="jamf-test-", dir=tmp)
+        cls.addClassCleanup(shutil.rmtree, cls._tmpdir, ignore_errors=True)
+        cls.config_path = path.join(cls._tmpdir, "jamf.config.plist")
         cls.hostname = "https://localhost"
         cls.username = "test"
         cls.password = "test"
@@ -42,6 +78,21 @@ class ConfigTests(unittest.TestCase):
             prompt=False,
         )
 
+    def _clean(self):
+        """
+        remove the test config file if it exists
+        """
+        Path(self.config_path).unlink(missing_ok=True)
+
+    def _empty_config(self):
+        """
+        Config with no prefs, for load()/loads() to fill in (skips __init__)
+        """
+        config = Config.__new__(Config)
+        config.config_path = self.config_path
+        config.hostname = config.username = config.password = None
+        return config
+
     def test_parameters(self):
         """
         test parameters
@@ -53,36 +104,34 @@ class ConfigTests(unittest.TestCase):
 
     def test_save(self):
         """
-        test save pref
+        test save and load pref file
         """
-        if path.exists(self.config_path):
-            remove(self.config_path)
-            self.assertTrue(not path.exists(self.config_path))
+        self._clean()
         self.config.save()
         self.assertTrue(path.exists(self.config_path))
-        remove(self.config_path)
+        config = self._empty_config()
+        config.load()
+        self.assertEqual(config.hostname, self.hostname)
+        self.assertEqual(config.username, self.username)
+        self.assertEqual(config.password, self.password)
+        self._clean()
 
     def test_load(self):
         """
-        test load pref
+        test load pref (in memory)
         """
-        if path.exists(self.config_path):
-            remove(self.config_path)
-            self.assertTrue(not path.exists(self.config_path))
-        self.config.save()
-        self.config.load()
-        self.assertEqual(self.config.hostname, self.hostname)
-        self.assertEqual(self.config.username, self.username)
-        self.assertEqual(self.config.password, self.password)
-        remove(self.config_path)
+        keyring.set_password(self.hostname, self.username, self.password)
+        config = self._empty_config()
+        config.loads(self.config.dumps())
+        self.assertEqual(config.hostname, self.hostname)
+        self.assertEqual(config.username, self.username)
+        self.assertEqual(config.password, self.password)
 
     def test_config_missing_load(self):
         """
         test config missing load
         """
-        if path.exists(self.config_path):
-            remove(self.config_path)
-            self.assertTrue(not path.exists(self.config_path))
+        self._clean()
         self.assertRaises(JamfConfigError, self.config.load)
 
     def test_token(self):
@@ -103,67 +152,45 @@ class ConfigTests(unittest.TestCase):
         """
         test config missing no prompt
         """
-        if path.exists(self.config_path):
-            remove(self.config_path)
-            self.assertTrue(not path.exists(self.config_path))
+        self._clean()
         self.assertRaises(JamfConfigError, lambda: Config(config_path=self.config_path))
 
     def test_malformed_config(self):
         """
         test malformed config
         """
-        if path.exists(self.config_path):
-            remove(self.config_path)
-            self.assertTrue(not path.exists(self.config_path))
+        self._clean()
         # write bad file
         f = open(self.config_path, "w")
         f.write("This isn't plist")
         f.close()
         self.assertRaises(JamfConfigError, lambda: Config(config_path=self.config_path))
 
-    def test_bad_hostname(self):
-        """
-        test bad hostname
-        """
-        self.assertRaises(
-            JamfConfigError,
-            lambda: Config(
-                config_path=self.config_path,
-                hostname="fail",
-                username="test",
-                password="test",
-                prompt=False,
-            ),
-        )
-
-    def test_http(self):
+    def test_hostnames(self):
         """
-        test http hostname
+        test http, https, and bad hostnames
         """
-        Config(
-            config_path=self.config_path,
-            hostname="http://localhost",
-            username="test",
-            password="test",
-            prompt=False,
-        )
-
-    def test_https(self):
-        """
-        test https hostname
-        """
-        Config(
-            config_path=self.config_path,
-            hostname="https://localhost",
-            username="test",
-            password="test",
-            prompt=False,
+        cases = (
+            ("http://localhost", True),
+            ("https://localhost", True),
+            ("fail", False),
         )
+        for hostname, valid in cases:
+            kwargs = {
+                "config_path": self.config_path,
+                "hostname": hostname,
+                "username": "test",
+                "password": "test",
+                "prompt": False,
+            }
+            with self.subTest(hostname=hostname):
+                if valid:
+                    Config(**kwargs)
+                else:
+                    self.assertRaises(JamfConfigError, Config, **kwargs)
 
     def test_reset(self):
-        if path.exists(self.config_path):
-            remove(self.config_path)
-            self.assertTrue(not path.exists(self.config_path))
+        self._clean()
         self.config.save()
         self.config.save_new_token("BlaBlaBla", "2022-05-12T00:28:08.131Z")
         self.assertTrue(path.exists(self.config_path))
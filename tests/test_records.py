@@ -2,6 +2,7 @@
 
 # https://developer.jamf.com/jamf-pro/
 
+import functools
 from os import environ
 from pprint import pprint
 
@@ -71,27 +72,14 @@ valid_records = (
     # "VPPInvitations",
 )
 
-pprint(valid_records)
-
 
+@functools.lru_cache(maxsize=None)
 def get_creds():
-    if "JAMF_HOSTNAME" in environ:
-        hostname = environ["JAMF_HOSTNAME"]
-    else:
-        hostname = HOSTNAME
-    if "JAMF_USERNAME" in environ:
-        username = environ["JAMF_USERNAME"]
-    else:
-        username = USERNAME
-    if "JAMF_PASSWORD" in environ:
-        password = environ["JAMF_PASSWORD"]
-    else:
-        password = PASSWORD
-    return (hostname, username, password)
-
-
-hostname, username, password = get_creds()
-jps = server.Server(debug=True, hostname=hostname, username=username, password=password)
+    return (
+        environ.get("JAMF_HOSTNAME", HOSTNAME),
+        environ.get("JAMF_USERNAME", USERNAME),
+        environ.get("JAMF_PASSWORD", PASSWORD),
+    )
 
 
 def print_one(item):
@@ -177,6 +165,10 @@ def post_patch_policy():
 
 
 def main():
+    pprint(valid_records)
+    hostname, username, password = get_creds()
+    # Server() sets its Classic client and debug flag on the record classes
+    server.Server(debug=True, hostname=hostname, username=username, password=password)
     for valid_record in valid_records:
         print("------------------------------------------------")
         print(valid_record)